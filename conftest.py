@@ -20,12 +20,15 @@ The following fixtures are defined in this file:
     - Stores options in a Config object as attributes
     - Passes (arbitrary) options around using the Config object
     - Needs to be injected into tests that rely on config
+* A session-level "http" fixture:
+    - Returns a requests.Session with pooled keep-alive connections
 * A session level "login" autouse fixture:
     - Sets up a Selenium webdriver instance using chromedriver
     - Logs into the web UI of the Datto device-under-test (DUT)
     - Is loaded automatically and does not have to be injected
-* A module level fixture:
-    - Restores the device to a known "vanilla" state
+* A function level "I" fixture:
+    - Yields the lead actor to each test
+    - Clears cookies after each test instead of spawning a new browser
 
 Tests should be organized based on idempotent modules which
 run a sequence of tests and return the device to a known state.
@@ -62,13 +65,12 @@ When defining tests in modules, there are two ways to organize them:
    https://pytest-ordering.readthedocs.io/en/develop/
 """
 
-import argparse
-from datetime import datetime
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
-from urllib3.exceptions import MaxRetryError
-from selenium.webdriver import Remote as WebDriver
-from py.xml import html
 
 import webstage
 
@@ -78,9 +80,29 @@ CONFIG_FILE = "config.json"
 
 @pytest.fixture(scope="session", autouse=True)
 def config(pytestconfig) -> webstage.Config:
-    """Fixture returning a Config object for the session."""
-    # yield the existing Config object in pytestconfig
-    yield pytestconfig.getoption("cfg")
+    """Fixture returning a Config object for the session.
+
+    The configuration file is only loaded once a test actually runs, so
+    runs like --help or --collect-only don't read it or probe the base URL.
+    """
+    cfg = webstage.Config(CONFIG_FILE)
+
+    # override config file options with commandline options
+    for cli_option in cfg.CLI_OPTIONS:
+        value = pytestconfig.getoption(cli_option)
+        if value:
+            setattr(cfg, cli_option, value)
+
+    yield cfg
+
+
+@pytest.fixture(scope="session")
+def http():
+    """Fixture returning a requests.Session for tests that make HTTP requests.
+
+    The session is shared with the base URL check, so connections are reused.
+    """
+    yield webstage.http_session()
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -90,20 +112,44 @@ def lead_actor(config) -> webstage.Actor:
     A webstage.Actor encapsulates a webdriver instance. On init, the actor 
     logs in as the configured user at the specified base URL.
     """
-
-    # create a new  RemoteWebdriver instance using the args in the config
-    msg = ""
-    try:
-        actor = webstage.Actor(WebDriver(**config.webdriver), config)
-    except MaxRetryError:
-        msg = f"\nCould not connect to selenium server: " +\
-            config.webdriver["command_executor"] +\
-            "\nEnsure the server is installed and running."
+    # imported here so collection-only runs don't pay for them, fixture
+    # annotations aren't evaluated so webstage.Actor isn't loaded either
+    from urllib3.exceptions import MaxRetryError
+    from selenium.webdriver import Remote as WebDriver
+
+    # keep the connection to the selenium server alive between commands
+    # instead of paying a fresh TCP handshake for every command
+    webdriver_args = {"keep_alive": True, **config.webdriver}
+
+    # make sure the site is up while the browser is spawning, both mostly
+    # wait on the network so there's no point in doing one after the other
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        probe = pool.submit(config.verify_reachable)
+
+        # create a new  RemoteWebdriver instance using the args in the config
+        msg = ""
+        driver = None
+        try:
+            driver = WebDriver(**webdriver_args)
+        except MaxRetryError:
+            msg = f"\nCould not connect to selenium server: " +\
+                config.webdriver["command_executor"] +\
+                "\nEnsure the server is installed and running."
+
+        # problems with the site are reported first, without leaving a browser open
+        try:
+            probe.result()
+        except BaseException:
+            if driver is not None:
+                driver.quit()
+            raise
 
     # performing pytest.exit() outside the try-except is faster for some reason
     if msg:
         pytest.exit(msg)
 
+    actor = webstage.Actor(driver, config)
+    actor.start()
     yield actor
 
     # session teardown, close browser window
@@ -114,57 +160,47 @@ def lead_actor(config) -> webstage.Actor:
 def I(lead_actor) -> webstage.Actor:
     """Perform cleanup between acts"""
     yield lead_actor
-
-@pytest.fixture(scope="module", autouse=True)
-def reset():
-    """Fixture to reset DUT to known state."""
+    lead_actor.reset()
 
 
 def pytest_addoption(parser):
-    """Add commandline options to pytest and load configuration file."""
-    cfg = webstage.Config(CONFIG_FILE)
-
-    # pass loaded config object through hidden arg
-    parser.addoption(
-        "--cfg", action="store_const", const=cfg, default=cfg,
-        help=argparse.SUPPRESS
-    )
+    """Add commandline options to pytest."""
     # add options that can be passed in via the command line as args
-    parser.addoption("--base-url", action="store", dest="base_url", default=cfg.base_url,
+    parser.addoption("--base-url", action="store", dest="base_url", default=None,
         help="Base URL of site being tested, defaults to value in config.json")
 
 
-def pytest_collection_modifyitems(config, items):
-    """Ensure required options are specified and modify tests."""
-    # get previously loaded config object
-    cfg = config.getoption("cfg")
-
-    # override config object options with commandline options
-    for cli_option in cfg.CLI_OPTIONS:
-        value = config.getoption(cli_option)
-        if value:
-            setattr(cfg, cli_option, value)
-
-
-@pytest.mark.optionalhook
-def pytest_html_results_table_header(cells):
-    """Update HTML report table headers."""
-    cells.insert(2, html.th("Description"))
-    cells.insert(1, html.th("Time", class_="sortable time", col="time"))
-    cells.pop()
-
-
-@pytest.mark.optionalhook
-def pytest_html_results_table_row(report, cells):
-    """Add description and time columns to HTML report."""
-    cells.insert(2, html.td(report.description))
-    cells.insert(1, html.td(datetime.utcnow(), class_="col-time"))
-    cells.pop()
-
-
-@pytest.mark.hookwrapper
-def pytest_runtest_makereport(item, call):
-    """Add test docstrings as descriptions in the HTML report."""
-    outcome = yield
-    report = outcome.get_result()
-    report.description = str(item.function.__doc__)
+def pytest_configure(config):
+    """Register the HTML report hooks if an HTML report is being generated."""
+    if config.getoption("htmlpath", None):
+        config.pluginmanager.register(HtmlReport(), "webstage-html-report")
+
+
+class HtmlReport():
+    """pytest-html hooks, skipped entirely on runs without --html."""
+
+    @pytest.mark.optionalhook
+    def pytest_html_results_table_header(self, cells):
+        """Update HTML report table headers."""
+        from py.xml import html
+        cells.insert(2, html.th("Description"))
+        cells.insert(1, html.th("Time", class_="sortable time", col="time"))
+        cells.pop()
+
+    @pytest.mark.optionalhook
+    def pytest_html_results_table_row(self, report, cells):
+        """Add description and time columns to HTML report."""
+        from py.xml import html
+        cells.insert(2, html.td(report.description))
+        start = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(report.start))
+        cells.insert(1, html.td(start, class_="col-time"))
+        cells.pop()
+
+    @pytest.mark.hookwrapper
+    def pytest_runtest_makereport(self, item, call):
+        """Add test docstrings and start times to reports for the HTML report."""
+        outcome = yield
+        report = outcome.get_result()
+        report.description = str(item.function.__doc__)
+        # when the test phase started, shown in the HTML report time column
+        report.start = call.start
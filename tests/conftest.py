@@ -0,0 +1,20 @@
+"""Unit tests for webstage itself, which don't need a browser or a site.
+
+The top-level conftest.py loads config.json and starts a browser for every
+test through autouse fixtures, these are overridden here so the unit tests
+run on their own.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def config():
+    """No config file is loaded for unit tests."""
+    yield None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def lead_actor():
+    """No browser is started for unit tests."""
+    yield None
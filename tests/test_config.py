@@ -0,0 +1,193 @@
+import json
+import os
+import socket
+import ssl
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from webstage import config as config_module
+from webstage.config import Config
+
+WEBDRIVER = {"command_executor": "http://127.0.0.1:4444/wd/hub",
+    "desired_capabilities": {"browserName": "chrome"}}
+
+
+def write_config(path, base_url):
+    """Write a config file with the given base URL and valid webdriver args."""
+    path.write_text(json.dumps({"base_url": base_url, "webdriver": WEBDRIVER}))
+    return str(path)
+
+
+@pytest.mark.parametrize("base_url, expected", [
+    ("example.com", "http://example.com"),
+    ("localhost:8080", "http://localhost:8080"),
+    ("localhost:8080/app", "http://localhost:8080/app"),
+    ("http://example.com", "http://example.com"),
+    ("https://example.com/", "https://example.com/"),
+    ("HTTPS://example.com", "HTTPS://example.com"),
+])
+def test_base_url_is_normalized(tmp_path, base_url, expected):
+    """Base URLs without a scheme get http:// prepended."""
+    cfg = Config(write_config(tmp_path / "config.json", base_url))
+    assert cfg.base_url == expected
+
+
+@pytest.mark.parametrize("base_url, error", [
+    ("ftp://example.com", '"FTP" given'),
+    ("ftp:example.com", '"FTP" given'),
+    ("mailto:someone@example.com", '"MAILTO" given'),
+    ("", '"" given'),
+    ("http://", "Invalid URL"),
+    ("http:example.com", "Invalid URL"),
+    ("http://example .com", "Invalid URL"),
+])
+def test_base_url_is_rejected(tmp_path, base_url, error):
+    """Base URLs that aren't HTTP(S) or have nothing after the scheme exit."""
+    with pytest.raises(pytest.exit.Exception, match=error):
+        Config(write_config(tmp_path / "config.json", base_url))
+
+
+def test_load_is_cached_until_file_changes(tmp_path, monkeypatch):
+    """An unchanged config file is only parsed once per process."""
+    config_file = write_config(tmp_path / "config.json", "example.com")
+    Config(config_file)
+
+    def fail(data):
+        raise AssertionError("config file was parsed again")
+
+    # unchanged file, served from memory as a separate copy
+    with monkeypatch.context() as m:
+        m.setattr(config_module, "_loads", fail)
+        cfg = Config(config_file)
+        assert cfg.base_url == "http://example.com"
+        cfg.webdriver["desired_capabilities"]["browserName"] = "firefox"
+        assert Config(config_file).webdriver["desired_capabilities"]["browserName"] == "chrome"
+
+    # a different size is loaded again
+    write_config(tmp_path / "config.json", "example.org")
+    assert Config(config_file).base_url == "http://example.org"
+
+    # same size, different modification time is loaded again
+    write_config(tmp_path / "config.json", "example.net")
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert Config(config_file).base_url == "http://example.net"
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    """Answers every request with an empty page, as configured on the server."""
+
+    def do_HEAD(self):
+        self.reply(self.server.head_status)
+
+    def do_GET(self):
+        self.reply(200)
+
+    def reply(self, status):
+        self.server.methods.append(self.command)
+        self.send_response(status)
+        self.send_header("Content-Type", self.server.content_type)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    """A local HTTP server serving HTML, which tests can reconfigure."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SiteHandler)
+    server.head_status = 200
+    server.content_type = "text/html; charset=utf-8"
+    server.methods = []
+    server.url = f"http://127.0.0.1:{server.server_port}/"
+    # poll often so shutting the server down after each test is quick
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("content_type", ["text/html", "TEXT/HTML; charset=utf-8"])
+def test_verify_reachable_accepts_html(tmp_path, site, content_type):
+    """Any HTML content type passes, whatever its case and parameters."""
+    site.content_type = content_type
+    Config(write_config(tmp_path / "config.json", site.url)).verify_reachable()
+    assert site.methods == ["HEAD"]
+
+
+@pytest.mark.parametrize("head_status", [405, 501])
+def test_verify_reachable_falls_back_to_get(tmp_path, site, head_status):
+    """Servers that don't implement HEAD are probed with a GET instead."""
+    site.head_status = head_status
+    Config(write_config(tmp_path / "config.json", site.url)).verify_reachable()
+    assert site.methods == ["HEAD", "GET"]
+
+
+def test_verify_reachable_rejects_other_content_types(tmp_path, site):
+    site.content_type = "application/json"
+    cfg = Config(write_config(tmp_path / "config.json", site.url))
+    with pytest.raises(pytest.exit.Exception, match="Content-Type: application/json"):
+        cfg.verify_reachable()
+
+
+def test_verify_reachable_reports_tls_errors(tmp_path, site):
+    """HTTPS to a plain HTTP server fails with the request's error message."""
+    url = site.url.replace("http://", "https://")
+    cfg = Config(write_config(tmp_path / "config.json", url))
+    with pytest.raises(pytest.exit.Exception, match="Problem with"):
+        cfg.verify_reachable()
+
+
+def test_verify_reachable_reports_dns_errors(tmp_path, monkeypatch):
+    def getaddrinfo(host, *args, **kwargs):
+        raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+
+    monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo)
+    cfg = Config(write_config(tmp_path / "config.json", "http://nowhere.invalid/"))
+    with pytest.raises(pytest.exit.Exception,
+            match="(?s)Could not resolve the base URL host.*nowhere.invalid"):
+        cfg.verify_reachable()
+
+
+def test_dns_error_ignores_string_reasons():
+    """ssl.SSLError has a string reason, which isn't followed as an exception."""
+    error = ssl.SSLError(1, "wrong version number")
+    error.reason = "WRONG_VERSION_NUMBER"
+    assert config_module._dns_error(error) is None
+
+    dns_error = socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+    try:
+        try:
+            raise dns_error
+        except socket.gaierror:
+            raise error
+    except ssl.SSLError as e:
+        assert config_module._dns_error(e) is dns_error
+
+
+def test_load_reads_files_rewritten_after_stat(tmp_path, monkeypatch):
+    """The read isn't sized by a stat taken before the file was rewritten."""
+    config_file = write_config(tmp_path / "config.json", "example.com")
+    stat = os.stat(config_file)
+
+    def stale_stat(path, *args, **kwargs):
+        # the file grows between the stat and the read
+        write_config(tmp_path / "config.json", "a-much-longer-hostname.example.com")
+        return stat
+
+    monkeypatch.setattr(config_module.os, "stat", stale_stat)
+    cfg = Config(config_file)
+    assert cfg.base_url == "http://a-much-longer-hostname.example.com"
+
+
+def test_load_handles_short_reads(tmp_path, monkeypatch):
+    """Reads returning fewer bytes than asked for are continued until EOF."""
+    config_file = write_config(tmp_path / "config.json", "example.com")
+    read = os.read
+    monkeypatch.setattr(config_module.os, "read", lambda fd, n: read(fd, min(n, 16)))
+    assert Config(config_file).base_url == "http://example.com"
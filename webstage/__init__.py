@@ -1,2 +1,17 @@
-from .config import Config
-from .actor import Actor
+import importlib
+
+from .config import Config, http_session
+
+# Actor and Element import selenium, they're only loaded once they're used
+# so pytest runs that only collect or deselect tests don't pay for it
+_LAZY = {"Actor": ".actor", "Element": ".element"}
+
+__all__ = ["Config", "http_session", "Actor", "Element"]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,27 +1,57 @@
 """Defines an Actor class representing a user and used to encapsulate drivers."""
 
+import re
 from typing import Union
-from urllib.parse import urlparse
 
-from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver import Remote as WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from .config import Config
 from .element import Element
 
+# selectors with their own locator strategy, one named group per strategy:
+# a plain "#id" or '[id="id"]', a plain ".class", or an xpath
+SELECTOR = re.compile(
+    r'^(?:#(?P<id>[A-Za-z_][\w-]*)'
+    r'|\[id=(["\']?)(?P<id_attr>[\w-]+)\2\]'
+    r'|\.(?P<class_name>[A-Za-z_][\w-]*)'
+    r'|(?P<xpath>/.*))$', re.DOTALL)
+
+# urls goto() uses as-is: protocol-relative, any "scheme://", or one of the
+# schemes that don't take a "//" authority, in any case
+ABSOLUTE_URL = re.compile(
+    r'^(?://|[a-z][a-z0-9+.-]*://|(?:about|data|javascript|blob|mailto):)',
+    re.IGNORECASE)
+
 
 class Actor():
     """Encapsulates the selenium remote webdriver class"""
 
+    __slots__ = ("driver", "base_url", "_base_prefix", "_finders")
+
     def __init__(self, driver: WebDriver, config: Config):
         self.driver = driver
         self.base_url = config.base_url
+        # prepended to paths passed to goto()
+        self._base_prefix = config.base_url.rstrip("/") + "/"
+        # bound finders keyed by the SELECTOR group that matched, plus css
+        self._finders = {
+            "id": driver.find_element_by_id,
+            "id_attr": driver.find_element_by_id,
+            "class_name": driver.find_element_by_class_name,
+            "xpath": driver.find_element_by_xpath,
+            "css": driver.find_element_by_css_selector,
+        }
+
+    def start(self):
+        """Prepare the browser window, done once per session"""
         self.driver.maximize_window()
 
-    # def __getattr__(self, attr: str):
-    #     # passthru unknown attribute calls to the encapsulated webdriver
-    #     return self.driver.__getattribute__(attr)
+    def reset(self):
+        """Cheap cleanup between tests, reusing the same browser session"""
+        self.driver.delete_all_cookies()
+        # start the next test from the base url, not wherever this one ended
+        self.go_home()
 
     def finish(self):
         """Cleanup"""
@@ -32,32 +62,23 @@ class Actor():
 
     def goto(self, url: str):
         """Go to a particular url, or a path under the base url"""
-        parsed_url = urlparse(url)
-        # if there is no scheme and netloc, this is a path under the base url
-        if not parsed_url.scheme and not parsed_url.path:
-            # prepend the base url
-            url = f'{self.base_url}/{parsed_url.path.lstrip("/")}'
-            parsed_url = urlparse(url)
+        # absolute urls are used as-is, anything else is a path under the base url
+        if not ABSOLUTE_URL.match(url):
+            url = self._base_prefix + url.lstrip("/")
         self.driver.get(url)
 
     def see(self, something: Union[str, WebElement]) -> Element:
         """Check if a particular element exists on the page"""
-        if type(something) is str:
-            # convert everything to an xpath
-            # id
-            if something.startswith("#"):
-                return Element(self.driver.find_element_by_id(something))
-            # class
-            if something.startswith("."):
-                return Element(self.driver.find_element_by_class_name(something))
-            # xpath
-            if something.startswith("//"):
-                return Element(self.driver.find_element_by_xpath(something))
-            # CSS selector
-            try:
-                return Element(self.driver.find_element_by_css_selector(something))
-            except NoSuchElementException:
-                return Element(self.driver.find_element_by_name(something))
+        if isinstance(something, str):
+            # id, class name or xpath, skipping the browser's CSS selector engine
+            match = SELECTOR.match(something)
+            if match:
+                kind = match.lastgroup
+                return Element(self._finders[kind](match.group(kind)))
+            # CSS selector or element name, resolved in a single command
+            name = something.replace("\\", "\\\\").replace('"', '\\"')
+            css = f'{something}, [name="{name}"]'
+            return Element(self._finders["css"](css))
 
     def see_link(self, text: str):
         """See a link with given text"""
@@ -1,11 +1,103 @@
 """Defines a Config class for storing configuration options."""
 
 import os
+import re
 import sys
+import copy
 import json
-import requests
+import codecs
+import socket
+import operator
+import functools
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
+if TYPE_CHECKING:
+    import requests
+
+# read and write the config file with orjson when it's installed, it's a lot
+# faster, orjson only indents by two spaces so the json fallback does the same
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dump(obj, f) -> None:
+        f.write(_dumps(obj))
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    def _dump(obj, f) -> None:
+        # stream into the binary file without building the whole string first
+        json.dump(obj, codecs.getwriter("utf-8")(f), indent=2)
+
+
+def _freeze(value):
+    """Returns a read-only copy of nested dicts and lists."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(value[key]) for key in value})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    """Returns a mutable, JSON serializable copy of a frozen value."""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(value[key]) for key in value}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+# splits a base URL into an optional "scheme:" with its "//" and the rest,
+# which must not contain whitespace, a "host:port" is not mistaken for a
+# scheme, precompiled since it's matched on every uncached load
+_URL_RE = re.compile(
+    r"(?:(?P<scheme>[A-Za-z][A-Za-z0-9+.-]*):(?!\d+(?:[/?#]|$))(?P<slashes>//)?)?"
+    r"(?P<rest>\S*)")
+
+# validated options of config files already loaded by this process, keyed
+# by path, modification time and size so an edited config file is loaded again
+_LOAD_CACHE = {}
+
+
+def _dns_error(exc: BaseException):
+    """Returns the socket.gaierror behind a failed request, if there is one."""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        if isinstance(exc, socket.gaierror):
+            return exc
+        seen.add(id(exc))
+        # urllib3 keeps the underlying error as the reason of a MaxRetryError,
+        # but ssl.SSLError's reason is just a string such as "WRONG_VERSION_NUMBER"
+        reason = getattr(exc, "reason", None)
+        if not isinstance(reason, BaseException):
+            reason = None
+        exc = reason or exc.__cause__ or exc.__context__
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def http_session() -> "requests.Session":
+    """Returns an HTTP session shared by the process, reusing its connections."""
+    # requests is only imported once something actually makes a request
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 class Config():
     """Stores configuration options passed between tests.
@@ -18,16 +110,34 @@ class Config():
     in commandline arguments through pytest. These options include:
     * base_url
 
+    Validated options are kept in memory and reused by later loads in the
+    same process for as long as the configuration file's path, modification
+    time and size are unchanged.
+
     Attributes:
         base_url (str): The base URL of the site being tested.
     """
 
-    CLI_OPTIONS = ["base_url"]
+    CLI_OPTIONS = frozenset({"base_url"})
     REQUIRED_OPTIONS = CLI_OPTIONS
-    ALL_OPTIONS = REQUIRED_OPTIONS + ["webdriver"]
-    REQUIRED_WEBDRIVER_ARGS = ["command_executor", "desired_capabilities"]
+    REQUIRED_WEBDRIVER_ARGS = frozenset({"command_executor", "desired_capabilities"})
+    # ordered, so saved config files always list options the same way
+    ALL_OPTIONS = ("base_url", "webdriver")
+    # expected JSON type of each option, with a description for error messages
+    OPTION_TYPES = {
+        "base_url": (str, "a string"),
+        "webdriver": (dict, "an object"),
+    }
+    # fetches the values of ALL_OPTIONS from a Config in one call
+    _get_all_options = operator.attrgetter(*ALL_OPTIONS)
+    # URL schemes the base URL may use
+    SCHEMES = frozenset({"http", "https"})
+    # seconds to wait on the base URL before giving up, as (connect, read),
+    # so an unreachable host fails sooner than a slow page
+    PROBE_TIMEOUT = (3, 5)
 
-    default = {
+    # frozen so instances can't modify the defaults shared by every Config
+    default = _freeze({
         "base_url": "http://",
         "webdriver": {
             "command_executor": "http://127.0.0.1:4444/wd/hub",
@@ -41,114 +151,204 @@ class Config():
                 }
             }
         }
-    }
+    })
 
-    DEFAULT_CONFIG = json.dumps(default, indent=4)
-    DEFAULT_WEBDRIVER_ARGS = json.dumps(default["webdriver"], indent=4) +\
-        "\n\nSee: https://github.com/SeleniumHQ/selenium/wiki/DesiredCapabilities"
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def default_config(cls) -> bytes:
+        """Default config file contents, only serialized when first needed."""
+        return _dumps(_thaw(cls.default))
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def default_webdriver_args(cls) -> str:
+        """Default webdriver options, formatted for error messages."""
+        return _dumps(_thaw(cls.default["webdriver"])).decode() +\
+            "\n\nSee: https://github.com/SeleniumHQ/selenium/wiki/DesiredCapabilities"
 
     def __init__(self, config_file: str):
         """Inits Config object with options from config file."""
+        # read-only defaults, replaced by load() so they don't need copying
         self.base_url = self.default["base_url"]
         self.webdriver = self.default["webdriver"]
 
-        # create config file with reasonable defaults if it doesn't exist
-        if not os.path.isfile(config_file):
-            with open(config_file, 'w') as f:
-                f.write(self.DEFAULT_CONFIG)
-                self.exit(f"Created default {config_file}, please update it.")
-        self.load(config_file)
+        try:
+            self.load(config_file)
+        except FileNotFoundError as e:
+            if e.filename != config_file:
+                raise
+            # create config file with reasonable defaults if it doesn't exist,
+            # O_EXCL so parallel workers can't clobber each other's file
+            try:
+                fd = os.open(config_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL |
+                    getattr(os, "O_BINARY", 0), 0o644)
+            except FileExistsError:
+                self.exit(f"Default {config_file} was created by another run, "
+                    "please update it.")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self.default_config())
+            self.exit(f"Created default {config_file}, please update it.")
 
     def load(self, config_file: str) -> None:
         """Load options from a config file, overwriting attributes."""
         self.file = config_file
+        # skip parsing and validation if the config file hasn't changed,
+        # an edit within the mtime granularity still changes the size
+        stat = os.stat(config_file)
+        cache_key = (os.path.abspath(config_file), stat.st_mtime_ns, stat.st_size)
+        if self._load_cache(cache_key):
+            return
+
         # load options from config file
-        with open(config_file) as f:
-            cfg = json.loads(f.read())
-
-        # populate object attributes with values loaded from config file
-        for key in cfg:
-            # overwrite existing attribute values
-            setattr(self, key, cfg[key])
-
-        # ensure required options are specified, compile list of missing options
-        missing_options = []
-        missing_cli_options = []
-        for required_option in self.REQUIRED_OPTIONS:
-            if not hasattr(self, required_option):
-                missing_options.append(required_option)
-                if required_option in self.CLI_OPTIONS:
-                    missing_cli_options.append(required_option)
+        # read the whole file in one read call sized from the open file, not the
+        # stat above since it may have been rewritten in between, and skip the
+        # buffered file object's extra syscalls, reads can come up short so
+        # keep reading until EOF
+        fd = os.open(config_file, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            chunks = []
+            chunk = os.read(fd, os.fstat(fd).st_size)
+            while chunk:
+                chunks.append(chunk)
+                chunk = os.read(fd, 65536)
+        finally:
+            os.close(fd)
+        cfg = _loads(b"".join(chunks))
+
+        # populate object attributes with values loaded from config file,
+        # overwriting existing attribute values
+        self.__dict__.update(cfg)
+
+        # ensure required options are specified in the file itself, attributes
+        # always exist since __init__ fills them in with defaults
+        missing_options = sorted(self.REQUIRED_OPTIONS.difference(cfg))
+        missing_cli_options = [o for o in missing_options if o in self.CLI_OPTIONS]
 
         # exit with error message if any required options are missing
         if any(missing_options):
-            msg = f"The following required options are missing from {config_file}:\n" +\
-                '"' + {', "'.join(missing_options)} + '"\n\n' +\
-                f"Some options can be passed in via commandline args:\n" +\
-                '"--' + {', "--'.join(missing_cli_options)} + '"'
+            missing = '", "'.join(missing_options)
+            msg = f'The following required options are missing from {config_file}:\n' \
+                f'"{missing}"'
+            if missing_cli_options:
+                missing_cli = '", "--'.join(o.replace("_", "-") for o in missing_cli_options)
+                msg += f'\n\nSome options can be passed in via commandline args:\n' \
+                    f'"--{missing_cli}"'
+            self.exit(msg)
+
+        # exit with error message if any options have the wrong type, checked
+        # in the same pass as everything else instead of failing further down
+        wrong_types = [
+            f'"{option}" must be {description}'
+            for option, (option_type, description) in self.OPTION_TYPES.items()
+            if option in cfg and not isinstance(cfg[option], option_type)
+        ]
+        if wrong_types:
+            msg = f'The following options in {config_file} have the wrong type:\n' + \
+                "\n".join(wrong_types)
             self.exit(msg)
 
         # set warning message for missing webdriver option or args
         webdriver_msg = ""
-        if not hasattr(self, "webdriver"):
-            webdriver_msg = f'The "webdriver" options are missing from {config_file}'
+        if "webdriver" not in cfg:
+            webdriver_msg = f'The "webdriver" options are missing from {config_file}\n\n'
         else:
             # check remote webdriver args
-            missing_webdriver_args = []
-            for required_arg in self.REQUIRED_WEBDRIVER_ARGS:
-                if required_arg not in self.webdriver:
-                    missing_webdriver_args.append(required_arg)
+            missing_webdriver_args = sorted(self.REQUIRED_WEBDRIVER_ARGS.difference(self.webdriver))
 
             # set warning message if any webdriver args are missing
             if any(missing_webdriver_args):
+                missing = '", "'.join(missing_webdriver_args)
                 webdriver_msg = \
-                    f'The following "webdriver" options are missing from {config_file}:\n"' +\
-                    {', "'.join(missing_webdriver_args)} + '"\n\n'
+                    f'The following "webdriver" options are missing from {config_file}:\n' \
+                    f'"{missing}"\n\n'
 
         # write webdriver defaults to config file if they are unspecified
         if webdriver_msg:
             self.webdriver = self.default["webdriver"]
             self.save(config_file)
             webdriver_msg += f'Wrote default "webdriver" options to ' +\
-                f'{config_file}:\n' + self.DEFAULT_WEBDRIVER_ARGS +\
+                f'{config_file}:\n' + self.default_webdriver_args() +\
                 f'\n\nPlease update {config_file} and re-run'
             self.exit(webdriver_msg)
 
-        # use urllib.parse.urlparse to check the scheme
-        parsed_url = urlparse(self.base_url.rstrip("/"))
+        # check the scheme and the rest of the URL with a single regex match,
+        # URLs containing whitespace don't match at all
+        invalid_msg = f'\nInvalid URL in {config_file}:\n{self.base_url}'
+        url_match = _URL_RE.fullmatch(self.base_url)
+        if url_match is None:
+            self.exit(invalid_msg)
+        scheme, slashes, rest = url_match.group("scheme", "slashes", "rest")
+
         # if http:// or https:// not specified, assume http://
-        # but only if there is either a netloc or path (something more than just a scheme)
-        if not parsed_url.scheme and (parsed_url.netloc or parsed_url.path):
+        # but only if there is something more than just a scheme
+        if scheme is None and rest:
             self.base_url = "http://" + self.base_url
-            parsed_url = urlparse(self.base_url)
-        elif parsed_url.scheme not in ["http", "https"]:
+        elif (scheme or "").lower() not in self.SCHEMES:
             # error if non HTTP scheme is given
-            msg = f'\nBase URL in {config_file} must be HTTP or HTTPS, ' +\
-                f'"\n{parsed_url.scheme.upper()}" given:\n{self.base_url}'
+            msg = f'\nBase URL in {config_file} must be HTTP or HTTPS, ' \
+                f'"{(scheme or "").upper()}" given:\n{self.base_url}'
             self.exit(msg)
 
-        #  ensure there is a netloc or path after the http(s)://
-        if not (parsed_url.netloc or parsed_url.path):
-            msg = f'\nInvalid URL in {config_file}:\n{self.base_url}'
-            self.exit(msg)
+        #  ensure there is a host or path after the http(s)://
+        if (scheme and not slashes) or not rest.strip("/"):
+            self.exit(invalid_msg)
+
+        # remember the validated options for later loads of the same file
+        self._save_cache(cache_key, {option: getattr(self, option) for option in cfg})
 
-        # if the base URL is valid, test it with a GET request to make sure it works
+    def verify_reachable(self) -> None:
+        """Exit with an error unless the base URL responds with an HTML page."""
+        import requests
+
+        # test the base URL with a HEAD request to make sure it works,
+        # the page body itself is loaded by the browser later on
         # http://docs.python-requests.org/en/master/api#requests.Response
         r = None  # holds the response object
+        session = http_session()
         try:
-            r = requests.get(self.base_url)
+            r = session.head(self.base_url, allow_redirects=True, timeout=self.PROBE_TIMEOUT)
+            # some servers don't implement HEAD, fall back to a GET but only
+            # wait for the headers, the body is never downloaded
+            if r.status_code in (405, 501):
+                r = session.get(self.base_url, stream=True, timeout=self.PROBE_TIMEOUT)
+                r.close()
         except requests.exceptions.RequestException as e:
-            self.exit(f'\nProblem with {config_file}:\n' + str(e))
+            # give DNS problems a clear error message, unless it was the
+            # proxy's host that couldn't be resolved
+            dns_error = None
+            if not isinstance(e, requests.exceptions.ProxyError):
+                dns_error = _dns_error(e)
+            if dns_error is not None:
+                self.exit(f'\nCould not resolve the base URL host in {self.file}:\n' +
+                    f'{urlparse(self.base_url).hostname}: {dns_error}')
+            self.exit(f'\nProblem with {self.file}:\n' + str(e))
 
-        msg = f'Unreachable base URL in {config_file}:\n{self.base_url}'
+        msg = f'Unreachable base URL in {self.file}:\n{self.base_url}'
         if r is not None:
-            if r.status_code != 200 or r.headers["content-type"] != "text/html; charset=UTF-8":
+            # compare the media type only, charset and case don't matter
+            content_type = r.headers.get("content-type", "")
+            media_type = content_type.split(";", 1)[0].strip().lower()
+            if r.status_code != 200 or media_type != "text/html":
                 msg += f'\nGot HTTP status: {r.status_code} {r.reason}' +\
-                    f'\nContent-Type: {r.headers["content-type"]}'
+                    f'\nContent-Type: {content_type}'
                 self.exit(msg)
         else:
             self.exit(msg)
 
+    def _load_cache(self, key: tuple) -> bool:
+        """Load options validated earlier in this process under the same key."""
+        options = _LOAD_CACHE.get(key)
+        if options is None:
+            return False
+
+        # copied so changing one Config's options doesn't affect the others
+        self.__dict__.update(copy.deepcopy(options))
+        return True
+
+    def _save_cache(self, key: tuple, options: dict) -> None:
+        """Keep validated options in memory for later loads under the same key."""
+        _LOAD_CACHE[key] = copy.deepcopy(options)
+
     def exit(self, msg: str) -> None:
         """Exit using self.exit if we're running a pytest session, else just exit"""
         # space out whatever comes after the exit message
@@ -161,9 +361,8 @@ class Config():
 
     def save(self, config_file: str = None) -> None:
         """Saves Config options to JSON."""
-        output = {}
-        for opt in self.ALL_OPTIONS:
-            output[opt] = getattr(self, opt)
+        values = map(_thaw, self._get_all_options(self))
+        output = dict(zip(self.ALL_OPTIONS, values))
         if config_file:
-            with open(config_file, 'w') as f:
-                f.write(json.dumps(output, indent=4))
+            with open(config_file, 'wb') as f:
+                _dump(output, f)
@@ -6,11 +6,12 @@ from selenium.webdriver.remote.webelement import WebElement
 class Element(WebElement):
     """Encapsulates a selenium webelement with additional information and methods for assertions."""
 
-    def __init__(self, web_element: WebElement):
-        self.web_element = web_element
+    __slots__ = ()
 
-    def __getattr__(self, attr: str):
-        return getattr(self.web_element, attr)
+    def __init__(self, web_element: WebElement):
+        # take over the found element's reference, so the inherited WebElement
+        # methods work directly instead of through attribute delegation
+        super().__init__(web_element.parent, web_element.id, web_element._w3c)
 
     def and_has_text(self, text: str):
         """Check for text in a given element"""